@@ -0,0 +1,65 @@
+# bench/timeit_catalog.py
+# type: ignore
+
+import timeit
+
+from pypomo.catalog import Catalog
+from pypomo.parser.types import POEntry
+
+LOOPS = 100000
+
+
+def _build(header: str) -> Catalog:
+    entries = [
+        POEntry(msgid="", msgstr=header),
+        POEntry(msgid="Hello", msgstr="こんにちは"),
+        POEntry(
+            msgid="apple",
+            msgid_plural="apples",
+            msgstr_plural={0: "apple-0", 1: "apple-1", 2: "apple-2"},
+        ),
+    ]
+    return Catalog.from_po_entries(entries)
+
+
+# Prepare catalogs once (global)
+catalog = _build("Plural-Forms: nplurals=2; plural=(n != 1);\n")
+complex_catalog = _build(
+    "Plural-Forms: nplurals=3; "
+    "plural=n%10==1 && n%100!=11 ? 0 : n%10>=2 && n%10<=4 "
+    "&& (n%100<10 || n%100>=20) ? 1 : 2;\n"
+)
+
+
+def _run(label, stmt, setup):
+    t = timeit.timeit(stmt, setup=setup, number=LOOPS)
+    print(f"{label}: {t:.6f} sec for {LOOPS} loops")
+
+
+def bench_gettext():
+    _run("gettext hit", 'cat.gettext("Hello")', "from __main__ import catalog as cat")
+    _run("gettext miss", 'cat.gettext("Bye")', "from __main__ import catalog as cat")
+
+
+def bench_ngettext():
+    _run(
+        "ngettext n=1",
+        'cat.ngettext("apple", "apples", 1)',
+        "from __main__ import catalog as cat",
+    )
+    _run(
+        "ngettext n=5",
+        'cat.ngettext("apple", "apples", 5)',
+        "from __main__ import catalog as cat",
+    )
+    _run(
+        "ngettext complex",
+        'cat.ngettext("apple", "apples", 23)',
+        "from __main__ import complex_catalog as cat",
+    )
+
+
+if __name__ == "__main__":
+    print("=== Timeit catalog lookup benchmarks ===")
+    bench_gettext()
+    bench_ngettext()
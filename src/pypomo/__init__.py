@@ -8,16 +8,20 @@ Public API:
     - gettext(msgid: str) -> str
     - ngettext(singular: str, plural: str, n: int) -> str
     - _(msgid: str, *, plural: str | None = None, n: int | None = None) -> str
-    - translation(domain: str, localedir: str, languages: list[str] | None = None) -> Catalog
+    - translation(domain: str, localedir: str, languages: Iterable[str] | None = None, *, eager_load: bool = False) -> Catalog
 
 Advanced API:
 
     - Catalog: in-memory translation catalog
+    - CatalogMessage: normalized message stored in a Catalog
+    - LazyCatalog: Catalog that parses its .po files on first use
     - write_mo(path: str | Path, catalog: Catalog) -> None
 """
 
 from .catalog import Catalog
+from .catalog_message import CatalogMessage
 from .gettext import _, get_default_catalog, gettext, ngettext, translation
+from .lazy_catalog import LazyCatalog
 
 __all__ = [
     # gettext-style API
@@ -28,4 +32,6 @@ __all__ = [
     "get_default_catalog",
     # advanced / power-user API
     "Catalog",
+    "CatalogMessage",
+    "LazyCatalog",
 ]
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import ItemsView, Iterable, KeysView, Mapping, ValuesView
-from typing import Dict, Iterator, List, TypeVar, cast, overload
+from functools import lru_cache
+from types import CodeType
+from typing import Callable, Dict, Iterator, List, TypeVar, cast, overload
 
 from pypomo.catalog_message import CatalogMessage
 from pypomo.parser.types import POEntry
-from pypomo.utils.plural_forms import PluralRule
+from pypomo.utils.plural_forms import (
+    PluralRule,
+    extract_plural_forms,
+    is_integer_expression,
+    is_not_one_rule,
+)
 
 _T = TypeVar("_T")
 _MISSING = object()
@@ -23,7 +31,7 @@ class Catalog:
         - Build message objects from POEntry structures
 
     Internal notice:
-        - __messages is considered private
+        - _messages is considered private
         - External code should not rely on its structure
     """
 
@@ -41,21 +49,40 @@ class Catalog:
             list(languages) if languages is not None else []
         )
 
+        # Set by freeze(); all mutation paths check it
+        self._frozen: bool = False
+
         # Private internal storage of messages
-        self.__messages: Dict[str, CatalogMessage] = {}
+        self._messages: Dict[str, CatalogMessage] = {}
+
+        # Lookup index (SoA view of _messages, used by gettext / ngettext)
+        #   _singular_only: msgid -> resolved singular (msgstr[0] or singular)
+        #   _translations:  msgid -> plural forms indexed by plural index,
+        #                   only for messages with more than one form
+        #                   (absent == "singular only", no tuple allocated)
+        self._singular_only: Dict[str, str] = {}
+        self._translations: Dict[str, tuple[str, ...]] = {}
+
+        # Plural forms evaluator (None until loaded from header).
+        # Assigning plural_rule also regenerates _ngettext_fast.
+        self._plural_rule: PluralRule | None = None
 
-        # Plural forms evaluator (None until loaded from header)
-        self.plural_rule: PluralRule | None = None
         # Keep nplurals for compatibility with tests / mo_writer
-        self.nplurals: int | None = None
+        self._nplurals: int | None = None
+        self._nplurals_eff: int = 2
 
         # Raw header message (msgid == "")
         self._header_raw: str = ""
 
+        # ngettext specialized for the current plural rule (see plural_rule)
+        self._ngettext_fast: Callable[[str, str, int], str] = _compile_ngettext(
+            self._translations, self._singular_only, None
+        )
+
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}("
-            f"messages={len(self._get_messages())},"
+            f"messages={len(self._messages)},"
             f"language={self.effective_language!r},"
             f"nplurals={self.effective_nplurals},"
             f"header={bool(self._get_header())}"
@@ -63,22 +90,100 @@ class Catalog:
         )
 
     # ----------------------------------------
-    # Internal API for __messages
+    # Copy / pickle support
+    # ----------------------------------------
+    def __getstate__(self) -> Dict[str, object]:
+        # _ngettext_fast is bound to this instance's lookup dicts (and is
+        # not picklable); __setstate__ regenerates it for the new ones
+        state = self.__dict__.copy()
+        del state["_ngettext_fast"]
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self._ngettext_fast = _compile_ngettext(
+            self._translations, self._singular_only, self._plural_rule
+        )
+
+    # ----------------------------------------
+    # Internal API for _messages
     # ----------------------------------------
     def _get_messages(self) -> Dict[str, CatalogMessage]:
-        return self.__messages
+        return self._messages
 
     def _set_messages(self, messages: Dict[str, CatalogMessage]) -> None:
-        self.__messages = messages
+        self._check_mutable()
+        self._messages = messages
+
+        # Rebuild the lookup index in bulk.
+        # Clear in place: _ngettext_fast holds references to these dicts
+        intern = sys.intern
+        self._singular_only.clear()
+        self._singular_only.update(
+            {
+                intern(k): m.translations.get(0) or m.singular
+                for k, m in messages.items()
+            }
+        )
+        self._translations.clear()
+        self._translations.update(
+            {
+                k: _dense_forms(m.translations)
+                for k, m in messages.items()
+                if len(m.translations) > 1
+            }
+        )
 
     def _get_message(self, msgid: str) -> CatalogMessage | None:
-        return self.__messages.get(msgid)
+        return self._messages.get(msgid)
 
     def _set_message(self, message: CatalogMessage) -> None:
+        self._check_mutable()
         if message.msgid == "":
             # Header is always an explicit override
             self._set_header(message.singular, overwrite_plural=True)
-        self.__messages[message.msgid] = message
+        # Interned keys let lookups with literal msgids (interned by
+        # CPython) match on identity instead of comparing characters.
+        msgid = sys.intern(message.msgid)
+        self._messages[msgid] = message
+        self._index_message(msgid, message)
+
+    def _index_message(self, msgid: str, message: CatalogMessage) -> None:
+        translations = message.translations
+        if len(translations) > 1:
+            self._translations[msgid] = _dense_forms(translations)
+        else:
+            self._translations.pop(msgid, None)
+        # gettext always resolves to form 0, so store the final answer
+        self._singular_only[msgid] = translations.get(0) or message.singular
+
+    # ----------------------------------------
+    # Plural state
+    # ----------------------------------------
+    @property
+    def plural_rule(self) -> PluralRule | None:
+        return self._plural_rule
+
+    @plural_rule.setter
+    def plural_rule(self, rule: PluralRule | None) -> None:
+        self._check_mutable()
+        # Generate first: it calls rule.func and may raise, in which case
+        # the previous rule must stay fully in place
+        ngettext_fast = _compile_ngettext(
+            self._translations, self._singular_only, rule
+        )
+        self._plural_rule = rule
+        self._ngettext_fast = ngettext_fast
+
+    @property
+    def nplurals(self) -> int | None:
+        return self._nplurals
+
+    @nplurals.setter
+    def nplurals(self, value: int | None) -> None:
+        self._check_mutable()
+        self._nplurals = value
+        self._nplurals_eff = value if value is not None else 2
 
     # ----------------------------------------
     # Internal API for header
@@ -98,6 +203,7 @@ class Catalog:
             - True:
                 Always re-parse Plural-Forms from header.
         """
+        self._check_mutable()
         self._header_raw = value
 
         if overwrite_plural or self.plural_rule is None:
@@ -110,8 +216,7 @@ class Catalog:
         """
         Internal-only: iterate over stored Message objects.
         """
-        messages: Dict[str, CatalogMessage] = self._get_messages()
-        return messages.values()
+        return self._messages.values()
 
     # ----------------------------------------
     # Header: Parse plural-forms
@@ -123,12 +228,17 @@ class Catalog:
         The header is a concatenated string of lines like:
             "Language: en\\n"
             "Plural-Forms: nplurals=2; plural=(n != 1);\\n"
+
+        Detection and extraction happen in one scan (see
+        extract_plural_forms); folded continuation lines are joined
+        before the rule is parsed.
         """
-        if "Plural-Forms" not in header_msgstr:
+        value = extract_plural_forms(header_msgstr)
+        if value is None:
             return
 
         try:
-            rule = PluralRule.from_header(header_msgstr)
+            rule = PluralRule.from_header(value)
             self.plural_rule = rule
             self.nplurals = rule.nplurals
         except Exception:
@@ -148,25 +258,16 @@ class Catalog:
               (this matches gettext's built-in default when Plural-Forms
                is not specified: nplurals=2; plural=(n != 1))
         """
-        if self.plural_rule is None:
+        if self._plural_rule is None:
             return 0 if n == 1 else 1
-        return self.plural_rule(n)
+        return self._plural_rule(n)
 
     # ----------------------------------------
     # Lookup API
     # ----------------------------------------
     def gettext(self, msgid: str) -> str:
         """Return translated string or msgid if not found."""
-        message: CatalogMessage | None = self._get_message(msgid)
-        if message is None:
-            return msgid
-
-        # No plural translations -> use singular
-        if not message.translations:
-            return message.singular
-
-        # Singular form = index 0
-        return message.translations.get(0, message.singular)
+        return self._singular_only.get(msgid, msgid)
 
     def ngettext(self, singular: str, plural: str, n: int) -> str:
         """
@@ -184,31 +285,7 @@ class Catalog:
                 4) else if singular exists -> return singular
                 5) else -> fall back to original plural
         """
-        message: CatalogMessage | None = self._get_message(singular)
-
-        # 1) No translation at all -> behave like gettext
-        if message is None:
-            # No translation → return original strings
-            return singular if n == 1 else plural
-
-        # 2) Compute plural index using gettext-like rule
-        index = self._select_plural_index(n)
-        forms = message.translations
-
-        # 3) Use exact plural form if available
-        if index in forms:
-            return forms[index]
-
-        # 4) Fallback: msgstr[0] if present
-        if 0 in forms:
-            return forms[0]
-
-        # 5) Fallback: singular (translated)
-        if message.singular:
-            return message.singular
-
-        # 6) Very last resort: original plural argument
-        return plural
+        return self._ngettext_fast(singular, plural, n)
 
     # ----------------------------------------
     # Mutation helpers
@@ -221,17 +298,52 @@ class Catalog:
         """
         Merge messages from another Catalog.
 
-        This is a public helper that keeps __messages private, while still
+        This is a public helper that keeps _messages private, while still
         allowing catalogs built from different PO files to be merged.
         """
-        # Accessing __messages is allowed from within the same class
-        self.__messages.update(other.__messages)
+        self._check_mutable()
+
+        # Accessing _messages is allowed from within the same class
+        self._messages.update(other._messages)
+        self._singular_only.update(other._singular_only)
+
+        # Singular-only messages from other must drop our plural forms
+        translations = self._translations
+        if translations:
+            for msgid in other._singular_only.keys() - other._translations.keys():
+                translations.pop(msgid, None)
+        translations.update(other._translations)
 
         # If the current catalog has no plural_rule yet, inherit from other
         if self.plural_rule is None and other.plural_rule is not None:
             self.plural_rule = other.plural_rule
             self.nplurals = other.nplurals
 
+    # ----------------------------------------
+    # Freezing
+    # ----------------------------------------
+    def freeze(self) -> None:
+        """
+        Make this Catalog read-only.
+
+        After freezing, every mutation (add_*, merge, update, item
+        assignment, header / plural rule changes) raises TypeError.
+        A frozen Catalog can be shared between threads without locks
+        (a LazyCatalog serializes its own first load, see there).
+
+        Use copy() to obtain a mutable Catalog again.
+        """
+        self._frozen = True
+
+    @property
+    def frozen(self) -> bool:
+        """True if freeze() has been called."""
+        return self._frozen
+
+    def _check_mutable(self) -> None:
+        if self._frozen:
+            raise TypeError("Catalog is frozen")
+
     # ----------------------------------------
     # Construction helpers
     # ----------------------------------------
@@ -245,28 +357,36 @@ class Catalog:
             - Convert all non-header entries into Message instances
         """
         catalog = cls()
+        messages: Dict[str, CatalogMessage] = {}
+        intern = sys.intern
 
-        # messages
+        # Single pass: header is applied inline, messages are collected
+        # and indexed in bulk afterwards (no per-entry add_message call)
         for entry in entries:
+            msgid = entry.msgid
 
             # header
-            if entry.msgid == "":
+            if msgid == "":
                 catalog._set_header(entry.msgstr, overwrite_plural=True)
                 continue
 
             # normal entry
             # singular msgstr or fallback to msgid
-            singular = entry.msgstr if entry.msgstr else entry.msgid
-
-            msg = CatalogMessage(
-                msgid=entry.msgid,
-                singular=singular,
-                plural=entry.msgid_plural,
-                translations=entry.msgstr_plural.copy(),
+            singular = entry.msgstr or msgid
+
+            # Singular-only entries: build {0: singular} directly instead of
+            # copying the (empty) parser dict and filling index 0 afterwards.
+            # Plural dicts are still copied, since CatalogMessage normalizes
+            # them in place and POEntry must stay untouched.
+            msgstr_plural = entry.msgstr_plural
+            messages[intern(msgid)] = CatalogMessage(
+                msgid,
+                singular,
+                entry.msgid_plural,
+                msgstr_plural.copy() if msgstr_plural else {0: singular},
             )
 
-            catalog.add_message(msg)
-
+        catalog._set_messages(messages)
         return catalog
 
     # ----------------------------------------
@@ -306,7 +426,7 @@ class Catalog:
         else:
             singular = msgid
 
-        plural_map: Dict[int, str] = {i: f for i, f in enumerate(forms)}
+        plural_map: Dict[int, str] = dict(enumerate(forms))
 
         self._set_message(
             CatalogMessage(
@@ -327,9 +447,7 @@ class Catalog:
         Default is 2 (gettext fallback), which matches common behavior
         when Plural-Forms is missing.
         """
-        if self.nplurals is not None:
-            return self.nplurals
-        return 2
+        return self._nplurals_eff
 
     @property
     def effective_language(self) -> str | None:
@@ -366,15 +484,8 @@ class Catalog:
         if key == "":
             return self.header_msgstr()
 
-        message = self._get_message(key)
-        if message is None:
-            return key
-
-        # No plural translations → singular
-        if not message.translations:
-            return message.singular
-
-        return message.translations.get(0, message.singular)
+        # Resolved singular (msgstr[0] or singular) is precomputed on insert
+        return self._singular_only.get(key, key)
 
     def __setitem__(self, key: str, value: str) -> None:
         """
@@ -414,7 +525,7 @@ class Catalog:
         if key == "":
             return bool(self._get_header())
 
-        return bool(self._get_message(key) is not None)
+        return key in self._messages
 
     def __iter__(self) -> Iterator[str]:
         """
@@ -422,31 +533,31 @@ class Catalog:
 
         Synonym for keys().
         """
-        return iter(self._get_messages())
+        return iter(self._messages)
 
     def keys(self) -> KeysView[str]:
         """
         Return a view over message ids (including header with key "")
         """
-        return self._get_messages().keys()
+        return self._messages.keys()
 
     def values(self) -> ValuesView[CatalogMessage]:
         """
         Return a view over CatalogMessage objects (including header)
         """
-        return self._get_messages().values()
+        return self._messages.values()
 
     def items(self) -> ItemsView[str, CatalogMessage]:
         """
         Return a view over (msgid, CatalogMessage) pairs (including header)
         """
-        return self._get_messages().items()
+        return self._messages.items()
 
     def __len__(self) -> int:
         """
         Return the number of messages (including header)
         """
-        return len(self._get_messages())
+        return len(self._messages)
 
     # fmt: off
     @overload
@@ -482,7 +593,7 @@ class Catalog:
         if not isinstance(key, str):
             raise TypeError("Catalog keys must be str")
 
-        message = self._get_message(key)
+        message = self._messages.get(key)
         if message is not None:
             return message
 
@@ -498,6 +609,7 @@ class Catalog:
         Notes:
         - CatalogMessage objects are shared.
         - Internal dict/list containers are copied.
+        - The copy is never frozen.
         """
         new = Catalog(
             domain=self.domain,
@@ -506,7 +618,7 @@ class Catalog:
         )
 
         # messages (shadow copy)
-        new._set_messages(self._get_messages().copy())
+        new._set_messages(self._messages.copy())
 
         # header + plural info
         new._header_raw = self._header_raw
@@ -535,10 +647,12 @@ class Catalog:
         Note:
             Mapping[str, CatalogMessage] is assumed when isinstance(other, Mapping).
         """
+        set_message = self._set_message
+
         # Case 1: Catalog
         if isinstance(other, Catalog):
-            for _, message in other.items():
-                self._set_message(message)
+            for message in other._messages.values():
+                set_message(message)
             return
 
         # Case 2: Mapping[str, CatalogMessage]
@@ -549,7 +663,7 @@ class Catalog:
                 if not isinstance(message, CatalogMessage):
                     raise TypeError("Catalog values must be CatalogMessage")
                 # Delegate to internal setter (handles headar correctly)
-                self._set_message(message)
+                set_message(message)
             return
 
         raise TypeError(
@@ -558,3 +672,115 @@ class Catalog:
 
     def __delitem__(self, key: str) -> None:
         raise TypeError("Catalog does not support item deletion")
+
+
+def _dense_forms(translations: Mapping[int, str]) -> tuple[str, ...]:
+    """
+    Convert {index: form} into a tuple indexed by plural index.
+
+    Missing indices are filled with "" (treated as "no translation").
+    """
+    if not translations:
+        return ()
+    return tuple(translations.get(i, "") for i in range(max(translations) + 1))
+
+
+# Source template for Catalog._ngettext_fast.
+# {one} is the optional n == 1 shortcut, {miss} the untranslated result
+# and {index} is replaced by code that assigns the plural index for n.
+_NGETTEXT_TEMPLATE = """\
+def _ngettext_fast(singular, plural, n):
+{one}\
+    forms = _get_forms(singular)
+    if forms is None:
+        # Singular-only message (translated singular) or no translation
+        return _get_singular(singular) or {miss}
+{index}
+    if index < len(forms) and forms[index]:
+        return forms[index]
+    return _singular_only[singular] or plural
+"""
+
+# n == 1 resolves to form 0 -> same answer as gettext (one dict probe)
+_ONE_IS_SINGULAR_SRC = """\
+    if n == 1:
+        return _get_singular(singular, singular)
+"""
+
+_MISS_SRC = "(singular if n == 1 else plural)"
+
+# After the n == 1 shortcut, (n != 1) rules (and the default) always
+# select form 1 and a miss is always the plural.
+_NOT_ONE_INDEX_SRC = "    index = 1"
+_NOT_ONE_MISS_SRC = "plural"
+
+# Same semantics as PluralRule.func: errors -> 0, clamp to [0, nplurals)
+_RULE_INDEX_SRC = """\
+    try:
+        index = {py_expr}
+    except Exception:
+        index = 0
+    if index < 0:
+        index = 0
+    elif index >= {nplurals}:
+        index = {last}"""
+
+_CALL_INDEX_SRC = "    index = _plural_fn(n)"
+
+
+@lru_cache(maxsize=64)
+def _compile_ngettext_source(src: str) -> CodeType:
+    """
+    Compile generated ngettext source once per distinct plural rule.
+
+    Only the code object is shared; each Catalog still execs it into its
+    own namespace so the function binds that Catalog's lookup dicts.
+    """
+    return compile(src, "<ngettext>", "exec")
+
+
+def _compile_ngettext(
+    translations: Dict[str, tuple[str, ...]],
+    singular_only: Dict[str, str],
+    rule: PluralRule | None,
+) -> Callable[[str, str, int], str]:
+    """
+    Generate an ngettext function with the plural expression inlined.
+
+    The lookup dicts are bound into the function namespace, so they must
+    keep their identity for the lifetime of the Catalog.
+    Falls back to calling rule.func when py_expr is missing or fails
+    is_integer_expression (user-constructed rules).
+    """
+    namespace: Dict[str, object] = {
+        "__builtins__": {},
+        "len": len,
+        "Exception": Exception,
+        "_get_forms": translations.get,
+        "_singular_only": singular_only,
+        "_get_singular": singular_only.get,
+    }
+
+    miss_src = _MISS_SRC
+    if rule is None or is_not_one_rule(rule):
+        index_src = _NOT_ONE_INDEX_SRC
+        miss_src = _NOT_ONE_MISS_SRC
+    elif rule.py_expr is not None and is_integer_expression(rule.py_expr):
+        index_src = _RULE_INDEX_SRC.format(
+            py_expr=rule.py_expr,
+            nplurals=rule.nplurals,
+            last=rule.nplurals - 1,
+        )
+    else:
+        namespace["_plural_fn"] = rule.func
+        index_src = _CALL_INDEX_SRC
+
+    # Only safe when the rule maps 1 to index 0 (not e.g. Arabic, where
+    # n == 0 has its own form and n == 1 is index 1)
+    one_src = _ONE_IS_SINGULAR_SRC if rule is None or rule.func(1) == 0 else ""
+
+    code = _compile_ngettext_source(
+        _NGETTEXT_TEMPLATE.format(one=one_src, miss=miss_src, index=index_src)
+    )
+    exec(code, namespace)
+    return cast(Callable[[str, str, int], str], namespace["_ngettext_fast"])
@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
 from typing import Dict
 
 
-@dataclass(slots=True)
 class CatalogMessage:
     """
     Immutable-like message structure used by Catalog.
@@ -18,41 +16,68 @@ class CatalogMessage:
         dict[int, str] such that:
             - 0 always exists (singular form)
             - if plural is present → 1..n_forms exist
+
+    Implemented as a plain __slots__ class (not a dataclass): messages are
+    created once per PO entry, so construction cost matters for large
+    catalogs.
     """
 
-    msgid: str
-    singular: str
-    plural: str | None = None
-    translations: Dict[int, str] = field(
-        default_factory=lambda: dict[int, str]()
-    )
+    __slots__ = ("msgid", "singular", "plural", "translations")
 
-    # ----------------------------------------
-    # Normalization initializer
-    # ----------------------------------------
-    def __post_init__(self) -> None:
+    def __init__(
+        self,
+        msgid: str,
+        singular: str,
+        plural: str | None = None,
+        translations: Dict[int, str] | None = None,
+    ) -> None:
         # Guarantee singular consistency
-        if not self.singular:
-            self.singular = self.msgid
+        if not singular:
+            singular = msgid
 
         # Normalize plural: "" -> None
-        if self.plural == "":
-            self.plural = None
-
-        # Ensure translations[0] exists
-        if 0 not in self.translations:
-            self.translations[0] = self.singular
-
-        # Remove empty translations and fall back correctly
-        for idx, val in list(self.translations.items()):
-            if not val:
-                # idx = 0 -> fallback to singular
-                if idx == 0:
-                    self.translations[0] = self.singular
-                else:
+        if plural == "":
+            plural = None
+
+        if translations is None:
+            translations = {0: singular}
+        else:
+            # Ensure translations[0] exists
+            if 0 not in translations:
+                translations[0] = singular
+
+            # Remove empty translations and fall back correctly
+            for idx, val in translations.items():
+                if not val:
+                    # idx = 0 -> fallback to singular
                     # idx > 0 -> fallback to plural or singular
-                    fallback: str = self.plural or self.singular
-                    self.translations[idx] = fallback
+                    translations[idx] = singular if idx == 0 else (plural or singular)
+
+        self.msgid: str = msgid
+        self.singular: str = singular
+        self.plural: str | None = plural
+        self.translations: Dict[int, str] = translations
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"msgid={self.msgid!r}, "
+            f"singular={self.singular!r}, "
+            f"plural={self.plural!r}, "
+            f"translations={self.translations!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CatalogMessage):
+            return NotImplemented
+        return (
+            self.msgid == other.msgid
+            and self.singular == other.singular
+            and self.plural == other.plural
+            and self.translations == other.translations
+        )
+
+    __hash__ = None  # type: ignore[assignment]
 
     # ----------------------------------------
     # Helper Constructors
@@ -85,7 +110,7 @@ class CatalogMessage:
         Create a plural-aware message.
 
         forms: {0: "...", 1: "...", ...}
-        Missing forms will be normalized in __post_init__.
+        Missing forms will be normalized in __init__.
         """
         singular: str = forms.get(0) or msgid
         return cls(
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from pathlib import Path
 
 from .catalog import Catalog
+from .lazy_catalog import LazyCatalog
 from .parser.po_parser import POParser
 
 # ----------------------------------------
@@ -28,12 +30,18 @@ def get_default_catalog() -> Catalog:
 
 # ----------------------------------------
 # Public gettext APIs
+#
+# The catalog lookups are already single dict hits, so these read the
+# module global directly and only fall back to get_default_catalog()
+# before the first translation() call.
 # ----------------------------------------
 def gettext(msgid: str) -> str:
     """
     Translate msgid using the default catalog.
     """
-    catalog = get_default_catalog()
+    catalog = _default_catalog
+    if catalog is None:
+        catalog = get_default_catalog()
     return catalog.gettext(msgid)
 
 
@@ -41,7 +49,9 @@ def ngettext(singular: str, plural: str, n: int) -> str:
     """
     Plural-aware translate using the default catalog.
     """
-    catalog = get_default_catalog()
+    catalog = _default_catalog
+    if catalog is None:
+        catalog = get_default_catalog()
     return catalog.ngettext(singular, plural, n)
 
 
@@ -54,7 +64,9 @@ def _(msgid: str, *, plural: str | None = None, n: int | None = None) -> str:
         _("apple", plural="apples", n=3)
         _("apple", n=3)  # plural autodetected as "apples"
     """
-    catalog = get_default_catalog()
+    catalog = _default_catalog
+    if catalog is None:
+        catalog = get_default_catalog()
 
     if n is None:
         return catalog.gettext(msgid)
@@ -72,35 +84,55 @@ def _(msgid: str, *, plural: str | None = None, n: int | None = None) -> str:
 def translation(
     domain: str,
     localedir: str,
-    languages: list[str] | None = None,
+    languages: Iterable[str] | None = None,
+    *,
+    eager_load: bool = False,
 ) -> Catalog:
     """
     Load translations from .po files for the selected domain/languages.
 
+    By default the .po files are only located here and parsed on first
+    use (see LazyCatalog). Pass eager_load=True to parse and merge them
+    immediately, e.g. to surface parse errors at startup.
+
     This is a strict/mypy-friendly implementation.
     """
     global _default_catalog
 
-    langs = languages or []
-    parser = POParser()
+    # Materialize once: languages may be a one-shot iterator
+    langs = list(languages) if languages is not None else []
 
-    catalog = Catalog(
-        domain=domain,
-        localedir=localedir,
-        languages=langs,
-    )
+    base = Path(localedir)
+    filename = f"{domain}.po"
 
+    po_paths = []
     for lang in langs:
-        po_path = Path(localedir) / lang / "LC_MESSAGES" / f"{domain}.po"
-
-        if not po_path.exists():
-            continue
-
-        entries = parser.parse(po_path)
-        part = Catalog.from_po_entries(entries)
-
-        # Merge into main catalog
-        catalog.merge(part)
+        po_path = base / lang / "LC_MESSAGES" / filename
+
+        if po_path.exists():
+            po_paths.append(po_path)
+
+    catalog: Catalog
+    if eager_load:
+        parser = POParser()
+        catalog = Catalog(
+            domain=domain,
+            localedir=localedir,
+            languages=langs,
+        )
+        for po_path in po_paths:
+            entries = parser.parse(po_path)
+            part = Catalog.from_po_entries(entries)
+
+            # Merge into main catalog
+            catalog.merge(part)
+    else:
+        catalog = LazyCatalog(
+            domain=domain,
+            localedir=localedir,
+            languages=langs,
+            pending=po_paths,
+        )
 
     # update global catalog
     _default_catalog = catalog
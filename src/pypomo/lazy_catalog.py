@@ -0,0 +1,127 @@
+# src/pypomo/lazy_catalog.py
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List
+
+from pypomo.catalog import Catalog
+from pypomo.parser.po_parser import POParser
+
+# Catalog state that only exists once the pending .po files are loaded:
+# everything Catalog.__init__ sets up except configuration and the
+# freeze flag. Reading any of it triggers LazyCatalog.__getattr__.
+_CONFIG_ATTRS = frozenset({"domain", "localedir", "languages", "_frozen"})
+_DEFERRED_ATTRS = frozenset(vars(Catalog()).keys() - _CONFIG_ATTRS)
+
+
+class LazyCatalog(Catalog):
+    """
+    Catalog that parses its .po files on first use.
+
+    translation() returns a LazyCatalog by default, so processes that
+    never translate anything (or never touch a given domain) do not pay
+    for parsing.
+
+    The lookup state of a fresh Catalog is removed in __init__. The
+    first read of any of it goes through __getattr__, which loads the
+    pending files and then publishes the merged state. After that,
+    every attribute is a plain instance attribute again, so
+    steady-state lookups cost exactly the same as on a Catalog.
+
+    Notes:
+        - Loading is thread-safe: it runs under a lock into a separate
+          Catalog, and the result is published in one step. Concurrent
+          first lookups wait for it and never see a partial catalog.
+        - Parse errors surface on first use, not in translation().
+          Nothing is published on failure; the next access retries.
+        - freeze() may be called before loading. Loading does not
+          mutate this catalog until it publishes, so a frozen LazyCatalog
+          can be shared between threads like a frozen Catalog.
+    """
+
+    def __init__(
+        self,
+        domain: str | None = None,
+        localedir: str | None = None,
+        languages: Iterable[str] | None = None,
+        pending: Iterable[Path] = (),
+    ) -> None:
+        super().__init__(domain=domain, localedir=localedir, languages=languages)
+
+        self._pending: List[Path] = list(pending)
+        self._load_lock = threading.Lock()
+
+        # Nothing to load -> behave as a plain Catalog from the start
+        self._loaded: bool = not self._pending
+        if self._pending:
+            state = self.__dict__
+            for name in _DEFERRED_ATTRS:
+                del state[name]
+
+    # Hidden from type checkers, which would otherwise accept any
+    # attribute name on a LazyCatalog
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> object:
+            # Only reached when normal lookup fails, i.e. before the first load
+            if name not in _DEFERRED_ATTRS:
+                raise AttributeError(
+                    f"{self.__class__.__name__!r} object "
+                    f"has no attribute {name!r}"
+                )
+
+            self._load_pending()
+            return self.__dict__[name]
+
+    def __getstate__(self) -> Dict[str, object]:
+        # Not Catalog.__getstate__: before loading there is no
+        # _ngettext_fast to drop
+        with self._load_lock:
+            state = self.__dict__.copy()
+        del state["_load_lock"]
+        state.pop("_ngettext_fast", None)
+        # A copy loads its own files; never share the pending list
+        state["_pending"] = list(self._pending)
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        state = {**state, "_load_lock": threading.Lock()}
+        if state["_loaded"]:
+            super().__setstate__(state)
+        else:
+            # Deferred attrs (incl. _ngettext_fast) appear on first load
+            self.__dict__.update(state)
+
+    @property
+    def loaded(self) -> bool:
+        """True once the pending .po files have been parsed."""
+        return self._loaded
+
+    def _load_pending(self) -> None:
+        """Merge every pending .po file, then publish the result."""
+        with self._load_lock:
+            # Another thread finished loading while we waited
+            if self._loaded:
+                return
+
+            # Build off to the side; a parse error leaves self untouched
+            staging = Catalog()
+            parser = POParser()
+            for po_path in self._pending:
+                entries = parser.parse(po_path)
+                staging.merge(Catalog.from_po_entries(entries))
+
+            # Keep anything assigned before loading (e.g. nplurals)
+            state = self.__dict__
+            loaded = {
+                name: value
+                for name, value in staging.__dict__.items()
+                if name in _DEFERRED_ATTRS and name not in state
+            }
+            state.update(loaded)
+
+            self._pending = []
+            self._loaded = True
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import struct
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 from pypomo.catalog import Catalog
 
+# MO file header: magic, revision, nstrings, orig_table_offset,
+# trans_table_offset, hash_size, hash_offset (7 x uint32, little-endian)
+_HEADER = struct.Struct("<7I")
+
 
 def _build_message_map(catalog: Catalog) -> Dict[str, str]:
     """
@@ -20,7 +25,18 @@ def _build_message_map(catalog: Catalog) -> Dict[str, str]:
             msgid  = "singular\\x00plural"
             msgstr = "form0\\x00form1\\x00...\\x00formN"
     """
-    result: Dict[str, str] = {}
+    return dict(_build_message_pairs(catalog))
+
+
+def _build_message_pairs(catalog: Catalog) -> List[Tuple[str, str]]:
+    """
+    Build the (msgid, msgstr) pairs of _build_message_map as a list.
+
+    write_mo sorts this list in place, so no intermediate dict is built.
+    msgids are unique: catalog keys are, and the header is added once.
+    """
+    result: List[Tuple[str, str]] = []
+    append = result.append
 
     # ----------------------------------------
     # Header entry ("") must contain metadata
@@ -28,22 +44,26 @@ def _build_message_map(catalog: Catalog) -> Dict[str, str]:
     # Use catalog.header_msgstr() if available (raw PO header)
     # Otherwise build a minimal fallback header.
     header: str = _build_header(catalog)
-    result[""] = header
+    append(("", header))
 
     # ----------------------------------------
     # Normal messages
     # ----------------------------------------
-    for msg in catalog._iter_messages():
+    # Loop invariants hoisted out of the per-message loop
+    gettext = catalog.gettext
+    nplurals: int = catalog.nplurals if catalog.nplurals is not None else 1
+    form_range = range(nplurals)
+
+    # Public dict-like view over the stored messages (C-level iteration)
+    for msg in catalog.values():
 
         # Skip header entry (msgid="")
         if msg.msgid == "":
             continue
 
-        # No plural -> simple key/value
+        # No plural -> simple key/value (resolved singular from the catalog)
         if msg.plural is None or not msg.translations:
-            msgid = msg.msgid
-            msgstr = msg.translations.get(0, msg.singular)
-            result[msgid] = msgstr
+            append((msg.msgid, gettext(msg.msgid)))
             continue
 
         # Plural message
@@ -54,12 +74,11 @@ def _build_message_map(catalog: Catalog) -> Dict[str, str]:
         msgid = singular + "\x00" + plural
 
         # msgstr = join forms 0..nplurals-1
-        nplurals: int = catalog.nplurals if catalog.nplurals is not None else 1
-
+        translations = msg.translations
         forms: List[str] = []
-        for idx in range(nplurals):
-            if idx in msg.translations:
-                forms.append(msg.translations[idx])
+        for idx in form_range:
+            if idx in translations:
+                forms.append(translations[idx])
             else:
                 # Fallback if the PO file didn't define enough plural forms
                 if idx == 0:
@@ -68,7 +87,7 @@ def _build_message_map(catalog: Catalog) -> Dict[str, str]:
                     forms.append(msg.plural or msg.singular)
 
         msgstr = "\x00".join(forms)
-        result[msgid] = msgstr
+        append((msgid, msgstr))
 
     return result
 
@@ -130,6 +149,26 @@ def _build_header(catalog: Catalog) -> str:
     return "\n".join(lines) + "\n"
 
 
+def _encode_strings(strings: Sequence[str]) -> Tuple[List[int], bytes]:
+    """
+    UTF-8 encode strings as consecutive NUL-terminated byte strings.
+
+    Returns (byte lengths without the NUL, encoded data).
+
+    Plural msgids contain NUL themselves, so lengths cannot be recovered
+    by splitting the encoded data. For pure ASCII input the byte length
+    equals the str length, so everything is encoded in one call.
+    """
+    joined = "\0".join(strings) + "\0"
+    if joined.isascii():
+        return [len(s) for s in strings], joined.encode("ascii")
+
+    # str.encode defaults to UTF-8; map() calls it without per-item
+    # attribute lookups
+    encoded = list(map(str.encode, strings))
+    return list(map(len, encoded)), b"\0".join(encoded) + b"\0"
+
+
 def write_mo(path: str | Path, catalog: Catalog) -> None:
     """
     Write a GNU gettext-compatible .mo file from a Catalog instance.
@@ -142,80 +181,63 @@ def write_mo(path: str | Path, catalog: Catalog) -> None:
     """
     path = Path(path)
 
-    # Build {msgid: msgstr}
-    messages = _build_message_map(catalog)
+    # Build (msgid, msgstr) pairs
+    items = _build_message_pairs(catalog)
 
-    # MO spec requires msgid-sorted order
-    items: List[Tuple[str, str]] = sorted(
-        messages.items(), key=lambda kv: kv[0]
-    )
+    # MO spec requires msgid-sorted order.
+    # msgids are unique, so plain tuple ordering only ever compares msgids.
+    items.sort()
 
     # Header fields
     magic = 0x950412DE  # Little-endian magic
     revision = 0
     nstrings = len(items)
 
-    header_size = 7 * 4  # 7 uint32
+    header_size = _HEADER.size  # 7 uint32
     entry_size = 8  # (length, offset) = 2 uint32 values
 
     orig_table_offset = header_size
     trans_table_offset = orig_table_offset + nstrings * entry_size
     string_offset = trans_table_offset + nstrings * entry_size
 
-    # Prepare tables and string data buffer
-    orig_table: List[Tuple[int, int]] = []
-    trans_table: List[Tuple[int, int]] = []
-    string_data = bytearray()
-
-    current_offset = string_offset
-
-    # Pre-encode strings (UTF-8)
-    encoded_ids = [msgid.encode("utf-8") for msgid, _ in items]
-    encoded_strs = [msgstr.encode("utf-8") for _, msgstr in items]
-
-    # Build original msgid table
-    for b_msgid in encoded_ids:
-        length = len(b_msgid)
-        orig_table.append((length, current_offset))
-        string_data.extend(b_msgid + b"\0")
-        current_offset += length + 1
+    # Encode strings (UTF-8); items always holds at least the header
+    msgids, msgstrs = zip(*items)
+    id_lengths, id_data = _encode_strings(msgids)
+    str_lengths, str_data = _encode_strings(msgstrs)
+
+    # String data is every msgid, then every msgstr, each NUL-terminated.
+    # Offsets are the running sum of (length + 1) starting at string_offset.
+    lengths = id_lengths + str_lengths
+    offsets = accumulate((n + 1 for n in lengths), initial=string_offset)
+
+    # Flat (length, offset) pairs: msgid table first, then msgstr table.
+    # Both tables are contiguous, so they are packed in one call.
+    tables: List[int] = [v for pair in zip(lengths, offsets) for v in pair]
+
+    # Pack everything before opening the file: a packing error (e.g. an
+    # offset above uint32) must not leave an existing .mo truncated
+    header = _HEADER.pack(
+        magic,
+        revision,
+        nstrings,
+        orig_table_offset,
+        trans_table_offset,
+        0,  # hash_size
+        0,  # hash_offset
+    )
 
-    # Build translated msgstr table
-    for b_msgstr in encoded_strs:
-        length = len(b_msgstr)
-        trans_table.append((length, current_offset))
-        string_data.extend(b_msgstr + b"\0")
-        current_offset += length + 1
+    # Original + translated strings tables
+    table_data = struct.pack(f"<{4 * nstrings}I", *tables)
 
     # ----------------------------------------
-    # Build final binary output
+    # Write binary output
     # ----------------------------------------
-    out = bytearray()
-
-    # Header
-    out.extend(
-        struct.pack(
-            "<IIIIIII",
-            magic,
-            revision,
-            nstrings,
-            orig_table_offset,
-            trans_table_offset,
-            0,  # hash_size
-            0,  # hash_offset
-        )
-    )
-
-    # Original strings table
-    for length, offset in orig_table:
-        out.extend(struct.pack("<II", length, offset))
-
-    # Translated strings table
-    for length, offset in trans_table:
-        out.extend(struct.pack("<II", length, offset))
-
-    # Actual string data
-    out.extend(string_data)
-
-    # Write file
-    path.write_bytes(out)
+    # Segments are written one after another instead of being copied
+    # into a single buffer first (keeps peak memory at ~1x the file size).
+    with path.open("wb") as f:
+        f.write(header)
+        f.write(table_data)
+
+        # Actual string data
+        f.write(id_data)
+        f.write(str_data)
@@ -8,6 +8,9 @@ from typing import List, Optional
 
 from .types import POEntry
 
+# msgstr[n] "text"
+_MSGSTR_PLURAL_RE = re.compile(r'msgstr\[(\d+)\]\s+"(.*)"')
+
 
 class POParser:
     """
@@ -89,7 +92,7 @@ class POParser:
 
                 # the format of "msgstr[0] 'apple'"
                 #  -> Parse robustly with regular expressions
-                m = re.match(r'msgstr\[(\d+)\]\s+"(.*)"', line)
+                m = _MSGSTR_PLURAL_RE.match(line)
                 if m:
                     idx = int(m.group(1))
                     text = m.group(2)
@@ -7,29 +7,99 @@
 # - Converting C-style plural expressions into Python expressions
 # - Nested ternary operators (? :)
 # - && / || / ! operators
-# - Safe evaluation via restricted env
+# - Safe evaluation via restricted env (compiled once per rule)
 #
 # This module does *not* evaluate any untrusted Python code.
 # All expressions are converted from a limited subset of C syntax.
 
 from __future__ import annotations
 
-import re
+import ast
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable
 
 from .cache_manager import PluralExprCache, get_default_cache
 
-# Regex for extracting nplurals and plural expression from "Plural-Forms:" header
-_PLURAL_HEADER_RE = re.compile(
-    r"nplurals\s*=\s*(\d+)\s*;\s*plural\s*=\s*([^;]+)",
-    re.IGNORECASE,
-)
+_PLURAL_FORMS_KEY = "Plural-Forms:"
+
+
+# ----------------------------------------
+# Header parsing
+# ----------------------------------------
+def extract_plural_forms(header: str) -> str | None:
+    """
+    Return the value of the "Plural-Forms:" line of a header, or None.
+
+    The key must start a line. Folded continuation lines (starting with
+    whitespace) are joined with spaces, e.g.:
+        "Plural-Forms: nplurals=3;\n"
+        "    plural=(n==1 ? 0 : n<5 ? 1 : 2);\n"
+    """
+    start = header.find(_PLURAL_FORMS_KEY)
+    while start > 0 and header[start - 1] != "\n":
+        start = header.find(_PLURAL_FORMS_KEY, start + 1)
+    if start < 0:
+        return None
+
+    start += len(_PLURAL_FORMS_KEY)
+    end = header.find("\n", start)
+    while end >= 0 and header[end + 1 : end + 2] in (" ", "\t"):
+        end = header.find("\n", end + 1)
+    if end < 0:
+        end = len(header)
+
+    return header[start:end].replace("\n", " ").strip()
+
+
+def _parse_plural_forms(value: str) -> tuple[int, str] | None:
+    """
+    Extract (nplurals, expression) from a Plural-Forms value such as
+    "nplurals=2; plural=(n != 1);".
+
+    Returns None unless both fields are present and nplurals is a number.
+    """
+    nplurals: int | None = None
+    expr: str | None = None
+
+    for part in value.split(";"):
+        # Split on the first "=" only: expressions contain "==" / "!="
+        key, sep, field = part.partition("=")
+        if not sep:
+            continue
+        key = key.strip().lower()
+        if key == "nplurals":
+            field = field.strip()
+            if not (field.isascii() and field.isdigit()):
+                return None
+            nplurals = int(field)
+        elif key == "plural":
+            expr = field.strip()
+
+    if nplurals is None or not expr:
+        return None
+    return nplurals, expr
 
 
 # ----------------------------------------
 # Expression conversion
 # ----------------------------------------
+def _unwrap(s: str) -> str:
+    """Strip one pair of outer parentheses if they enclose the whole string."""
+    if s.startswith("(") and s.endswith(")"):
+        # Ensure parentheses actually match
+        depth = 0
+        for i, ch in enumerate(s):
+            if ch == "(":
+                depth += 1
+            elif ch == ")":
+                depth -= 1
+            if depth == 0 and i < len(s) - 1:
+                return s  # not a single outer pair
+        return s[1:-1].strip()
+    return s
+
+
 def _convert_ternary(expr: str) -> str:
     expr = expr.strip()
 
@@ -37,6 +107,11 @@ def _convert_ternary(expr: str) -> str:
     if "?" not in expr:
         return expr
 
+    # Whole expression wrapped in parentheses, e.g. "(n==1 ? 0 : 1)"
+    inner = _unwrap(expr)
+    if inner is not expr:
+        return f"({_convert_ternary(inner)})"
+
     # Find top-level ? :
     depth = 0
     q_pos = None
@@ -61,24 +136,9 @@ def _convert_ternary(expr: str) -> str:
     true_part = expr[q_pos + 1 : colon_pos].strip()
     false_part = expr[colon_pos + 1 :].strip()
 
-    # Unwrap outer parentheses correctly
-    def unwrap(s: str) -> str:
-        if s.startswith("(") and s.endswith(")"):
-            # Ensure parentheses actually match
-            depth = 0
-            for i, ch in enumerate(s):
-                if ch == "(":
-                    depth += 1
-                elif ch == ")":
-                    depth -= 1
-                if depth == 0 and i < len(s) - 1:
-                    return s  # not a single outer pair
-            return s[1:-1].strip()
-        return s
-
-    cond = _convert_ternary(unwrap(cond))
-    true_part = _convert_ternary(unwrap(true_part))
-    false_part = _convert_ternary(unwrap(false_part))
+    cond = _convert_ternary(_unwrap(cond))
+    true_part = _convert_ternary(_unwrap(true_part))
+    false_part = _convert_ternary(_unwrap(false_part))
 
     return f"({true_part} if ({cond}) else ({false_part}))"
 
@@ -92,6 +152,7 @@ def _compile_plural_expr(expr: str) -> str:
         &&  -> and
         ||  -> or
         !x  -> not x
+        a / b -> a // b
         cond ? a : b  -> (a if cond else b)
     """
     s = expr.strip()
@@ -103,20 +164,152 @@ def _compile_plural_expr(expr: str) -> str:
     # Replace logical operators
     s = s.replace("&&", " and ").replace("||", " or ")
 
-    # Temporarily replace "!=" to safely handle "!"
-    s = s.replace("!=", "__NE__")
-
-    # Replace !foo → not foo
-    s = re.sub(r"!\s*", " not ", s)
+    # C integer division (n is never negative, so floor == truncation)
+    s = s.replace("/", "//")
 
-    # Restore "!="
-    s = s.replace("__NE__", "!=")
+    # Replace !foo → not foo (plain str.replace, no regex needed).
+    # "!=" is protected by temporarily replacing it.
+    if "!" in s:
+        s = s.replace("!=", "__NE__").replace("!", " not ")
+        s = s.replace("__NE__", "!=")
 
     # Convert ternary operator
     s = _convert_ternary(s)
     return s
 
 
+# ----------------------------------------
+# Plural function construction
+# ----------------------------------------
+# Hand-written functions for the most common rules. The key is the
+# converted expression with whitespace and outer parentheses removed;
+# the value is (minimum nplurals, func) so that clamping stays implicit.
+def _plural_not_one(n: int) -> int:
+    return 0 if n == 1 else 1
+
+
+_COMMON_PLURAL_FUNCS: dict[str, tuple[int, Callable[[int], int]]] = {
+    "0": (1, lambda n: 0),
+    "n!=1": (2, _plural_not_one),
+    "n>1": (2, lambda n: 1 if n > 1 else 0),
+}
+
+# AST nodes a converted gettext rule may consist of. Every expression
+# built only from these (with the name "n" and int constants) evaluates
+# to an int or bool, or raises (e.g. ZeroDivisionError).
+_INTEGER_EXPR_NODES = (
+    ast.Expression,
+    ast.IfExp,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.UnaryOp,
+    ast.Not,
+    ast.UAdd,
+    ast.USub,
+    ast.BinOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Compare,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+)
+
+
+@lru_cache(maxsize=256)
+def is_integer_expression(py_expr: str) -> bool:
+    """
+    True if py_expr is a single expression over n and int constants.
+
+    This is the one validation rule for compiled plural code: only such
+    expressions are turned into functions or inlined by Catalog.
+    Tuples ("n,1"), lists, calls, attribute access and float literals
+    are rejected.
+    """
+    try:
+        tree = ast.parse(py_expr.strip(), mode="eval")
+    except SyntaxError:
+        return False
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _INTEGER_EXPR_NODES):
+            return False
+        if isinstance(node, ast.Name) and node.id != "n":
+            return False
+        if isinstance(node, ast.Constant) and type(node.value) is not int:
+            return False
+    return True
+
+
+def is_not_one_rule(rule: PluralRule) -> bool:
+    """True for the English-style rule (n != 1) with at least 2 forms."""
+    return rule.nplurals >= 2 and rule.func is _plural_not_one
+
+
+# Template for all other rules. The expression is compiled once into a
+# real function so `n` is a fast local instead of an eval() locals dict.
+_PLURAL_FUNC_TEMPLATE = """\
+def _plural(n):
+    try:
+        value = {expr}
+    except Exception:
+        return 0
+    if value < 0:
+        return 0
+    if value >= {nplurals}:
+        return {last}
+    return value
+"""
+
+
+@lru_cache(maxsize=256)
+def _build_plural_func(py_expr: str, nplurals: int) -> Callable[[int], int]:
+    """
+    Build the n -> index function for an already converted expression.
+
+    The result is clamped to [0, nplurals) and returns 0 when evaluation
+    fails, matching gettext's lenient behaviour.
+
+    Built functions are stateless, so they are shared between all rules
+    (and catalogs) with the same expression and nplurals.
+
+    Raises:
+        SyntaxError: If py_expr fails is_integer_expression().
+    """
+    key = _unwrap("".join(py_expr.split()))
+    common = _COMMON_PLURAL_FUNCS.get(key)
+    if common is not None and nplurals >= common[0]:
+        return common[1]
+
+    # Reject anything that is not a plain integer expression before
+    # templating (the result is compared and clamped without int())
+    if not is_integer_expression(py_expr):
+        raise SyntaxError(f"Unsupported plural expression: {py_expr!r}")
+
+    src = _PLURAL_FUNC_TEMPLATE.format(
+        expr=f"({py_expr})",
+        nplurals=nplurals,
+        last=nplurals - 1,
+    )
+    namespace: dict[str, object] = {
+        "__builtins__": {},
+        "Exception": Exception,
+    }
+    exec(compile(src, "<plural>", "exec"), namespace)
+    func: Callable[[int], int] = namespace["_plural"]  # type: ignore[assignment]
+    return func
+
+
 # ----------------------------------------
 # Default cache
 # ----------------------------------------
@@ -137,11 +330,13 @@ class PluralRule:
         nplurals: Number of plural forms.
         expr:     Original C-like plural expression.
         func:     Callable that maps n -> plural index.
+        py_expr:  Converted Python expression (None if not available).
     """
 
     nplurals: int
     expr: str
     func: Callable[[int], int]
+    py_expr: str | None = None
 
     def __call__(self, n: int) -> int:
         """Convenience: rule(n) → index."""
@@ -164,13 +359,17 @@ class PluralRule:
             "Language: en\n"
             "Plural-Forms: nplurals=2; plural=(n != 1);\n"
 
+        The bare value ("nplurals=2; plural=(n != 1);") is accepted too.
+
         Fallback behavior:
             If no plural rule is found, English-style (n != 1) is assumed.
         """
         cache = cache or DEFAULT_CACHE
 
-        m = _PLURAL_HEADER_RE.search(header)
-        if not m:
+        # Full header -> only look at what follows the Plural-Forms key
+        _, found, value = header.partition(_PLURAL_FORMS_KEY)
+        parsed = _parse_plural_forms(value if found else header)
+        if parsed is None:
             # Default: English-like rule
             return cls(
                 nplurals=2,
@@ -178,11 +377,11 @@ class PluralRule:
                 func=lambda n: 0 if n == 1 else 1,
             )
 
-        nplurals = int(m.group(1))
-        raw_expr = m.group(2).strip()
+        nplurals, raw_expr = parsed
 
         try:
             py_expr = cache.get_or_compile(raw_expr)
+            func = _build_plural_func(py_expr, nplurals)
         except Exception:
             # Expression invalid → treat all as singular (0)
             return cls(
@@ -191,24 +390,7 @@ class PluralRule:
                 func=lambda n: 0,
             )
 
-        # Construct the safe eval function (restricted env)
-        def _func(n: int) -> int:
-            try:
-                value = eval(py_expr, {"__builtins__": {}}, {"n": n})
-                if not isinstance(value, int):
-                    value = int(value)
-            except Exception:
-                # fallback: treat all plural values as 0 (singular form)
-                return 0
-
-            # Clamp index to valid range
-            if value < 0:
-                return 0
-            if value >= nplurals:
-                return nplurals - 1
-            return value
-
-        return cls(nplurals=nplurals, expr=raw_expr, func=_func)
+        return cls(nplurals=nplurals, expr=raw_expr, func=func, py_expr=py_expr)
 
     @classmethod
     def from_expression(
@@ -234,6 +416,7 @@ class PluralRule:
 
         try:
             py_expr = cache.get_or_compile(expr)
+            func = _build_plural_func(py_expr, nplurals)
         except Exception:
             # Invalid expression → always return 0
             return cls(
@@ -242,19 +425,4 @@ class PluralRule:
                 func=lambda n: 0,
             )
 
-        def _func(n: int) -> int:
-            try:
-                value = eval(py_expr, {"__builtins__": {}}, {"n": n})
-                if not isinstance(value, int):
-                    value = int(value)
-            except Exception:
-                return 0
-
-            # Clamp to valid range
-            if value < 0:
-                value = 0
-            if value >= nplurals:
-                return nplurals - 1
-            return value
-
-        return cls(nplurals=nplurals, expr=expr, func=_func)
+        return cls(nplurals=nplurals, expr=expr, func=func, py_expr=py_expr)
@@ -0,0 +1,33 @@
+# tests/bench/test_catalog_bench.py
+# type: ignore
+
+from __future__ import annotations
+
+from pypomo.catalog import Catalog
+from pypomo.parser.types import POEntry
+
+
+def _catalog() -> Catalog:
+    entries = [
+        POEntry(
+            msgid="",
+            msgstr="Plural-Forms: nplurals=2; plural=(n != 1);\n",
+        ),
+        POEntry(msgid="Hello", msgstr="こんにちは"),
+        POEntry(
+            msgid="apple",
+            msgid_plural="apples",
+            msgstr_plural={0: "りんご", 1: "りんごたち"},
+        ),
+    ]
+    return Catalog.from_po_entries(entries)
+
+
+def test_gettext_benchmark(benchmark):
+    cat = _catalog()
+    benchmark(lambda: cat.gettext("Hello"))
+
+
+def test_ngettext_benchmark(benchmark):
+    cat = _catalog()
+    benchmark(lambda: cat.ngettext("apple", "apples", 5))
@@ -1,6 +1,9 @@
 # tests/test_catalog_basic.py
 # type: ignore
 
+import copy
+import pickle
+
 from pypomo.catalog import Catalog
 from pypomo.parser.types import POEntry
 
@@ -27,3 +30,93 @@ def test_catalog_gettext():
 
     assert catalog.gettext("Hello") == "こんにちは"
     assert catalog.gettext("Unknown") == "Unknown"
+
+
+def test_catalog_from_po_entries_does_not_mutate_entries():
+    singular = POEntry(msgid="Hello", msgstr="こんにちは")
+    plural = POEntry(
+        msgid="apple",
+        msgid_plural="apples",
+        msgstr_plural={1: ""},
+    )
+
+    catalog = Catalog.from_po_entries([singular, plural])
+
+    assert catalog.get("Hello").translations == {0: "こんにちは"}
+    assert singular.msgstr_plural == {}
+    assert plural.msgstr_plural == {1: ""}
+
+
+# ----------------------------------------
+# Mutations are visible to later lookups
+# ----------------------------------------
+def _plural_catalog() -> Catalog:
+    header = POEntry(
+        msgid="",
+        msgstr="Language: en\nPlural-Forms: nplurals=2; plural=(n != 1);\n",
+    )
+    entry = POEntry(
+        msgid="apple",
+        msgstr="",
+        msgid_plural="apples",
+        msgstr_plural={0: "apple", 1: "apples"},
+    )
+    return Catalog.from_po_entries([header, entry])
+
+
+def test_gettext_sees_overwritten_message():
+    cat = Catalog()
+    cat["hello"] = "こんにちは"
+    assert cat.gettext("hello") == "こんにちは"
+
+    cat["hello"] = "やあ"
+    assert cat.gettext("hello") == "やあ"
+
+
+def test_gettext_sees_message_added_after_miss():
+    cat = Catalog()
+    assert cat.gettext("bye") == "bye"
+
+    cat.add_singular("bye", "さようなら")
+    assert cat.gettext("bye") == "さようなら"
+
+
+def test_ngettext_selects_form_by_plural_index():
+    cat = _plural_catalog()
+
+    assert cat.ngettext("apple", "apples", 2) == "apples"
+    assert cat.ngettext("apple", "apples", 100) == "apples"
+    assert cat.ngettext("apple", "apples", 1) == "apple"
+
+
+def test_ngettext_sees_merged_messages():
+    cat = _plural_catalog()
+    assert cat.ngettext("apple", "apples", 5) == "apples"
+
+    other = Catalog()
+    other.add_plural("apple", "apples", ["りんご", "りんごたち"])
+    cat.merge(other)
+
+    assert cat.ngettext("apple", "apples", 5) == "りんごたち"
+
+
+def test_deepcopy_ngettext_reads_its_own_messages():
+    cat = Catalog()
+    cat.add_plural("apple", "apples", ["A0", "A1"])
+
+    dup = copy.deepcopy(cat)
+    dup.add_plural("apple", "apples", ["B0", "B1"])
+
+    assert dup.gettext("apple") == "B0"
+    assert dup.ngettext("apple", "apples", 5) == "B1"
+    assert cat.ngettext("apple", "apples", 5) == "A1"
+
+
+def test_pickle_roundtrip():
+    cat = Catalog()
+    cat.add_plural("apple", "apples", ["A0", "A1"])
+
+    restored = pickle.loads(pickle.dumps(cat))
+
+    assert restored.gettext("apple") == "A0"
+    assert restored.ngettext("apple", "apples", 5) == "A1"
@@ -0,0 +1,63 @@
+# tests/test_catalog_freeze.py
+# type: ignore
+
+import pytest
+
+from pypomo.catalog import Catalog
+from pypomo.catalog_message import CatalogMessage
+from pypomo.utils.plural_forms import PluralRule
+
+
+def _frozen_catalog() -> Catalog:
+    cat = Catalog()
+    cat[""] = "Language: ja\nPlural-Forms: nplurals=1; plural=0;\n"
+    cat["hello"] = "こんにちは"
+    cat.add_plural("apple", "apples", ["りんご"])
+    cat.freeze()
+    return cat
+
+
+def test_frozen_catalog_lookups_still_work():
+    cat = _frozen_catalog()
+
+    assert cat.frozen
+    assert cat.gettext("hello") == "こんにちは"
+    assert cat.ngettext("apple", "apples", 3) == "りんご"
+    assert cat["hello"] == "こんにちは"
+    assert "hello" in cat
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda c: c.__setitem__("hello", "やあ"),
+        lambda c: c.add_singular("bye", "さようなら"),
+        lambda c: c.add_plural("ball", "balls", ["ボール"]),
+        lambda c: c.add_message(CatalogMessage.from_singular("x", "y")),
+        lambda c: c.update({"x": CatalogMessage.from_singular("x", "y")}),
+        lambda c: c.merge(Catalog()),
+        lambda c: c.__setitem__("", "Language: en\n"),
+        lambda c: setattr(c, "plural_rule", PluralRule.from_expression("0", 1)),
+        lambda c: setattr(c, "nplurals", 2),
+    ],
+)
+def test_frozen_catalog_rejects_mutation(mutate):
+    cat = _frozen_catalog()
+
+    with pytest.raises(TypeError):
+        mutate(cat)
+
+    # State is unchanged
+    assert cat.gettext("hello") == "こんにちは"
+    assert cat.nplurals == 1
+
+
+def test_copy_of_frozen_catalog_is_mutable():
+    cat = _frozen_catalog()
+    new = cat.copy()
+
+    assert not new.frozen
+    new["hello"] = "やあ"
+
+    assert new.gettext("hello") == "やあ"
+    assert cat.gettext("hello") == "こんにちは"
@@ -0,0 +1,44 @@
+# tests/test_catalog_message.py
+# type: ignore
+
+import pytest
+
+from pypomo.catalog_message import CatalogMessage
+
+
+def test_message_normalizes_fields():
+    msg = CatalogMessage(
+        "apple",
+        singular="",
+        plural="",
+        translations={1: ""},
+    )
+
+    assert msg.singular == "apple"
+    assert msg.plural is None
+    assert msg.translations == {0: "apple", 1: "apple"}
+
+
+def test_message_default_translations():
+    msg = CatalogMessage("hello", "こんにちは")
+
+    assert msg.translations == {0: "こんにちは"}
+
+
+def test_message_equality_and_repr():
+    a = CatalogMessage.from_singular("hello", "こんにちは")
+    b = CatalogMessage("hello", singular="こんにちは")
+
+    assert a == b
+    assert a != CatalogMessage.from_singular("hello", "やあ")
+    assert "msgid='hello'" in repr(a)
+
+    with pytest.raises(TypeError):
+        hash(a)
+
+
+def test_message_has_no_instance_dict():
+    msg = CatalogMessage("hello", "こんにちは")
+
+    with pytest.raises(AttributeError):
+        msg.extra = 1
@@ -3,8 +3,11 @@
 
 from __future__ import annotations
 
-from pypomo.catalog import Catalog
+import pytest
+
+from pypomo.catalog import Catalog, CatalogMessage
 from pypomo.parser.types import POEntry
+from pypomo.utils.plural_forms import PluralRule
 
 
 def test_catalog_from_po_entries_plural_forms_english() -> None:
@@ -57,3 +60,155 @@ def test_catalog_from_po_entries_plural_forms_japanese() -> None:
     # Any n should return singular
     assert catalog.ngettext("apple", "apples", 1) == "りんご"
     assert catalog.ngettext("apple", "apples", 3) == "りんご"
+
+
+def test_catalog_assigning_plural_rule_rebinds_evaluator() -> None:
+    catalog = Catalog()
+    catalog.add_plural("apple", "apples", ["りんご", "りんごたち"])
+
+    # default rule: n != 1
+    assert catalog.ngettext("apple", "apples", 0) == "りんごたち"
+
+    # Direct assignment (as done by the .mo catalog builder)
+    catalog.plural_rule = PluralRule.from_expression("0", nplurals=1)
+    catalog.nplurals = 1
+
+    assert catalog.effective_nplurals == 1
+    assert catalog.ngettext("apple", "apples", 0) == "りんご"
+
+    # Reset to default
+    catalog.plural_rule = None
+    catalog.nplurals = None
+
+    assert catalog.effective_nplurals == 2
+    assert catalog.ngettext("apple", "apples", 0) == "りんごたち"
+
+
+def test_catalog_ngettext_sparse_forms_fallback_to_first() -> None:
+    catalog = Catalog()
+    catalog.plural_rule = PluralRule.from_expression(
+        "n==1 ? 0 : n==2 ? 1 : 2", nplurals=3
+    )
+    catalog.nplurals = 3
+
+    # form 1 is missing
+    catalog.add_message(
+        CatalogMessage(
+            "ball",
+            singular="ボール",
+            plural="balls",
+            translations={0: "ボール", 2: "ボールたち"},
+        )
+    )
+
+    assert catalog.ngettext("ball", "balls", 1) == "ボール"
+    assert catalog.ngettext("ball", "balls", 2) == "ボール"
+    assert catalog.ngettext("ball", "balls", 5) == "ボールたち"
+
+
+def test_catalog_ngettext_inlined_rule_clamps_index() -> None:
+    catalog = Catalog()
+    catalog.add_plural("apple", "apples", ["a0", "a1"])
+
+    # Rule yields indices beyond nplurals -> clamped to last form
+    catalog.plural_rule = PluralRule.from_expression("n", nplurals=2)
+
+    assert catalog.ngettext("apple", "apples", 0) == "a0"
+    assert catalog.ngettext("apple", "apples", 1) == "a1"
+    assert catalog.ngettext("apple", "apples", 7) == "a1"
+
+
+def test_catalog_ngettext_invalid_rule_falls_back_to_first_form() -> None:
+    catalog = Catalog()
+    catalog.add_plural("apple", "apples", ["a0", "a1"])
+
+    # Name error at evaluation time -> index 0 (same as PluralRule)
+    catalog.plural_rule = PluralRule.from_expression("INVALID", nplurals=2)
+    assert catalog.ngettext("apple", "apples", 5) == "a0"
+
+    # Not a single expression -> evaluated through rule.func
+    catalog.plural_rule = PluralRule.from_expression("n ? 1", nplurals=2)
+    assert catalog.ngettext("apple", "apples", 5) == "a0"
+
+
+def test_catalog_ngettext_one_not_mapped_to_first_form() -> None:
+    # Arabic-like: n == 0 has its own form, n == 1 is index 1
+    catalog = Catalog()
+    catalog.plural_rule = PluralRule.from_expression(
+        "n==0 ? 0 : n==1 ? 1 : 2", nplurals=3
+    )
+    catalog.add_plural("day", "days", ["d0", "d1", "d2"])
+
+    assert catalog.ngettext("day", "days", 0) == "d0"
+    assert catalog.ngettext("day", "days", 1) == "d1"
+    assert catalog.ngettext("day", "days", 3) == "d2"
+
+    # Missing messages still follow gettext fallback
+    assert catalog.ngettext("hour", "hours", 1) == "hour"
+    assert catalog.ngettext("hour", "hours", 2) == "hours"
+
+
+def test_catalog_ngettext_english_rule_with_single_form() -> None:
+    catalog = Catalog()
+    catalog.plural_rule = PluralRule.from_expression("(n != 1)", nplurals=2)
+    catalog.add_plural("apple", "apples", ["a0"])
+
+    assert catalog.ngettext("apple", "apples", 1) == "a0"
+    assert catalog.ngettext("apple", "apples", 0) == "a0"
+    assert catalog.ngettext("pear", "pears", 0) == "pears"
+
+    # nplurals=1 clamps every n to form 0
+    catalog.plural_rule = PluralRule.from_expression("n != 1", nplurals=1)
+    catalog.add_plural("apple", "apples", ["a0", "a1"])
+    assert catalog.ngettext("apple", "apples", 5) == "a0"
+
+
+def test_catalog_singular_message_replaces_plural_forms() -> None:
+    catalog = Catalog()
+    catalog.add_plural("apple", "apples", ["a0", "a1"])
+    assert catalog.ngettext("apple", "apples", 5) == "a1"
+
+    # add_singular on the same msgid -> translated singular for every n
+    catalog.add_singular("apple", "りんご")
+    assert catalog.ngettext("apple", "apples", 5) == "りんご"
+
+    # Same through merge()
+    catalog.add_plural("pear", "pears", ["p0", "p1"])
+    other = Catalog()
+    other["pear"] = "なし"
+    catalog.merge(other)
+    assert catalog.ngettext("pear", "pears", 1) == "なし"
+    assert catalog.ngettext("pear", "pears", 5) == "なし"
+
+
+def test_catalog_plural_rule_setter_is_all_or_nothing() -> None:
+    catalog = Catalog()
+    catalog.add_plural("apple", "apples", ["a0", "a1"])
+    before = catalog.plural_rule
+
+    def broken(n: int) -> int:
+        raise RuntimeError("broken rule")
+
+    with pytest.raises(RuntimeError):
+        catalog.plural_rule = PluralRule(nplurals=2, expr="?", func=broken)
+
+    assert catalog.plural_rule is before
+    assert catalog._select_plural_index(5) == 1
+    assert catalog.ngettext("apple", "apples", 5) == "a1"
+
+
+def test_catalog_header_with_non_integer_rule() -> None:
+    catalog = Catalog()
+    catalog.add_plural("apple", "apples", ["a0", "a1"])
+    catalog[""] = "Plural-Forms: nplurals=2; plural=n,1;\n"
+
+    # Rejected expression -> always form 0, state stays consistent
+    assert catalog.nplurals == 2
+    assert catalog._select_plural_index(5) == 0
+    assert catalog.ngettext("apple", "apples", 5) == "a0"
+
+    # A hand-built rule with such a py_expr is not inlined
+    catalog.plural_rule = PluralRule(
+        nplurals=2, expr="n,1", func=lambda n: 1, py_expr="n,1"
+    )
+    assert catalog.ngettext("apple", "apples", 5) == "a1"
@@ -37,3 +37,17 @@ def test_translation_loads_po_and_applies_plural_rules(write_po) -> None:
     assert catalog.gettext("Hello") == "Hello!"
     assert catalog.ngettext("apple", "apples", 1) == "apple"
     assert catalog.ngettext("apple", "apples", 3) == "apples"
+
+
+def test_translation_accepts_language_iterator(write_po) -> None:
+    po_path: Path = write_po(
+        "messages", "ja", ['msgid "Hello"', 'msgstr "こんにちは"']
+    )
+    localedir = str(po_path.parent.parent.parent)
+
+    catalog = translation(
+        domain="messages", localedir=localedir, languages=iter(["ja"])
+    )
+
+    assert catalog.languages == ["ja"]
+    assert catalog.gettext("Hello") == "こんにちは"
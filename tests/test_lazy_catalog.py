@@ -0,0 +1,169 @@
+# tests/test_lazy_catalog.py
+# type: ignore
+
+from __future__ import annotations
+
+import copy
+import threading
+from pathlib import Path
+
+import pytest
+
+from pypomo.catalog import Catalog
+from pypomo.gettext import translation
+from pypomo.lazy_catalog import LazyCatalog
+from pypomo.parser.po_parser import POParser
+
+_HEADER = [
+    'msgid ""',
+    'msgstr ""',
+    '"Plural-Forms: nplurals=2; plural=(n != 1);\\n"',
+    "",
+]
+
+
+def _localedir(write_po) -> str:
+    write_po(
+        "messages",
+        "ja",
+        _HEADER + ['msgid "Hello"', 'msgstr "こんにちは"', ""]
+        + ['msgid "Bye"', 'msgstr "さようなら"'],
+    )
+    po_path = write_po(
+        "messages",
+        "en",
+        _HEADER + ['msgid "Hello"', 'msgstr "Hello!"'],
+    )
+    return str(po_path.parent.parent.parent)
+
+
+def test_translation_defers_parsing(write_po):
+    localedir = _localedir(write_po)
+
+    catalog = translation("messages", localedir, ["ja", "en"])
+
+    assert isinstance(catalog, LazyCatalog)
+    assert not catalog.loaded
+
+    assert catalog.gettext("Bye") == "さようなら"
+    assert catalog.loaded
+
+    # Loaded state is plain instance data again
+    assert "_singular_only" in vars(catalog)
+
+
+def test_lazy_matches_eager_merge_order(write_po):
+    localedir = _localedir(write_po)
+
+    lazy = translation("messages", localedir, ["ja", "en"])
+    eager = translation("messages", localedir, ["ja", "en"], eager_load=True)
+
+    assert type(eager) is Catalog
+    assert dict(lazy.items()) == dict(eager.items())
+    assert lazy.gettext("Hello") == eager.gettext("Hello") == "Hello!"
+    assert lazy.nplurals == eager.nplurals == 2
+
+
+def test_lazy_load_on_frozen_catalog(write_po):
+    localedir = _localedir(write_po)
+
+    catalog = translation("messages", localedir, ["ja"])
+    catalog.freeze()
+
+    assert catalog.ngettext("Hello", "Hellos", 1) == "こんにちは"
+    assert catalog.frozen
+
+
+def test_lazy_catalog_without_files_is_plain():
+    catalog = LazyCatalog(domain="messages")
+
+    assert catalog.loaded
+    assert catalog.gettext("Hello") == "Hello"
+
+
+def test_concurrent_first_lookup_sees_loaded_catalog(write_po):
+    lines = _HEADER + [
+        line
+        for i in range(5000)
+        for line in (f'msgid "m{i}"', f'msgstr "t{i}"', "")
+    ]
+    write_po("big", "ja", lines)
+    po_path = write_po("big", "en", lines)
+    localedir = str(po_path.parent.parent.parent)
+
+    for _ in range(5):
+        catalog = translation("big", localedir, ["ja", "en"])
+        barrier = threading.Barrier(8)
+        results = []
+
+        def lookup():
+            barrier.wait()
+            results.append(catalog.gettext("m4999"))
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == ["t4999"] * 8
+
+
+def test_failed_load_is_retried(write_po, monkeypatch):
+    localedir = _localedir(write_po)
+    catalog = translation("messages", localedir, ["ja"])
+
+    def broken_parse(self, path):
+        raise OSError("disk error")
+
+    monkeypatch.setattr(POParser, "parse", broken_parse)
+    with pytest.raises(OSError):
+        catalog.gettext("Bye")
+    assert not catalog.loaded
+
+    monkeypatch.undo()
+    assert catalog.gettext("Bye") == "さようなら"
+    assert catalog.loaded
+
+
+def test_deepcopy_before_and_after_load(write_po):
+    localedir = _localedir(write_po)
+    catalog = translation("messages", localedir, ["ja"])
+
+    before = copy.deepcopy(catalog)
+    assert not before.loaded
+    assert before.gettext("Bye") == "さようなら"
+    assert not catalog.loaded
+
+    after = copy.deepcopy(catalog)
+    after.add_singular("Bye", "じゃあね")
+    assert after.loaded
+    assert after.gettext("Bye") == "じゃあね"
+    assert catalog.gettext("Bye") == "さようなら"
+
+
+def test_copy_does_not_share_pending_files(write_po):
+    localedir = _localedir(write_po)
+    catalog = translation("messages", localedir, ["ja"])
+
+    dup = copy.copy(catalog)
+    assert dup.gettext("Bye") == "さようなら"
+
+    assert dup.loaded
+    assert not catalog.loaded
+    assert catalog.gettext("Bye") == "さようなら"
+
+
+def test_deferred_attrs_cover_catalog_state():
+    # Everything but configuration is deferred until the first load
+    catalog = LazyCatalog(domain="messages", pending=[Path("unused.po")])
+
+    assert set(vars(catalog)) == {
+        "domain",
+        "localedir",
+        "languages",
+        "_frozen",
+        "_pending",
+        "_load_lock",
+        "_loaded",
+    }
@@ -2,8 +2,11 @@
 # type: ignore
 
 import gettext
+import struct
 from pathlib import Path
 
+import pytest
+
 from pypomo.catalog import Catalog
 from pypomo.mo.writer import write_mo
 from pypomo.parser.types import POEntry
@@ -211,3 +214,18 @@ def test_write_and_read_mo(tmp_path):
     assert trans.gettext("Hello") == "こんにちは"
     assert trans.ngettext("apple", "apples", 1) == "りんご"
     assert trans.ngettext("apple", "apples", 5) == "りんご"
+
+
+def test_mo_writer_pack_error_keeps_existing_file(tmp_path, monkeypatch):
+    mo_path = tmp_path / "messages.mo"
+    mo_path.write_bytes(b"existing")
+
+    def broken_pack(fmt, *values):
+        raise struct.error("offset out of range")
+
+    monkeypatch.setattr(struct, "pack", broken_pack)
+
+    with pytest.raises(struct.error):
+        write_mo(mo_path, Catalog())
+
+    assert mo_path.read_bytes() == b"existing"
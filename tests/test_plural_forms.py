@@ -57,3 +57,30 @@ def test_plural_forms_english():
 
     assert cat.ngettext("apple", "apples", 1) == "apple"
     assert cat.ngettext("apple", "apples", 5) == "apples"
+
+
+# ------------------------------------
+# Folded (multi-line) Plural-Forms header
+# ------------------------------------
+def test_plural_forms_folded_header_line():
+    cat = Catalog()
+    cat[""] = (
+        "Language: xx\n"
+        "Plural-Forms: nplurals=3;\n"
+        "    plural=n==1 ? 0 : n==2 ? 1 : 2;\n"
+    )
+    cat.add_plural("ball", "balls", ["b0", "b1", "b2"])
+
+    assert cat.nplurals == 3
+    assert cat.ngettext("ball", "balls", 1) == "b0"
+    assert cat.ngettext("ball", "balls", 2) == "b1"
+    assert cat.ngettext("ball", "balls", 7) == "b2"
+
+
+def test_plural_forms_key_must_start_a_line():
+    cat = Catalog()
+    cat[""] = "X-Note: see Plural-Forms: nplurals=1; plural=0;\n"
+
+    # Not a Plural-Forms header line -> defaults are kept
+    assert cat.plural_rule is None
+    assert cat.nplurals is None
@@ -128,3 +128,73 @@ def test_negative_numbers():
 def test_large_numbers():
     rule = PluralRule.from_expression("n > 1", 2)
     assert rule(1000000) == 1
+
+
+def test_ternary_wrapped_in_parentheses():
+    # Standard Russian header form: the whole ternary is parenthesized
+    rule = PluralRule.from_expression(
+        "(n%10==1 && n%100!=11 ? 0 : "
+        "n%10>=2 && n%10<=4 && (n%100<10 || n%100>=20) ? 1 : 2)",
+        nplurals=3,
+    )
+    assert rule(1) == 0
+    assert rule(21) == 0
+    assert rule(3) == 1
+    assert rule(5) == 2
+    assert rule(11) == 2
+
+
+def test_index_clamped_to_nplurals():
+    rule = PluralRule.from_expression("n", nplurals=3)
+    assert rule(-5) == 0
+    assert rule(1) == 1
+    assert rule(10) == 2
+
+    # Common rule with too few forms still clamps
+    single = PluralRule.from_expression("n != 1", nplurals=1)
+    assert single(5) == 0
+
+
+def test_from_header_accepts_bare_value():
+    rule = PluralRule.from_header("nplurals=3; plural=n==1 ? 0 : n==2 ? 1 : 2;")
+    assert rule.nplurals == 3
+    assert rule(2) == 1
+    assert rule(9) == 2
+
+    # nplurals must be a number
+    rule = PluralRule.from_header("nplurals=x; plural=0;")
+    assert rule.nplurals == 2
+    assert rule.expr == "n != 1"
+
+
+def test_compiled_function_shared_between_rules():
+    header = "Plural-Forms: nplurals=3; plural=n%10==1 ? 0 : n%10==2 ? 1 : 2;\n"
+
+    first = PluralRule.from_header(header)
+    second = PluralRule.from_header(header)
+    assert first.func is second.func
+
+    # nplurals is part of the key (it controls clamping)
+    other = PluralRule.from_expression("n%10==1 ? 0 : n%10==2 ? 1 : 2", 2)
+    assert other.func is not first.func
+    assert other(3) == 1
+
+
+def test_division_is_integer_division():
+    rule = PluralRule.from_expression("n / 10", nplurals=3)
+    assert rule(9) == 0
+    assert rule(15) == 1
+    assert rule(99) == 2
+
+    # Float literals are not valid gettext syntax -> always 0
+    rule = PluralRule.from_expression("n * 0.5", nplurals=3)
+    assert rule.py_expr is None
+    assert rule(4) == 0
+
+
+def test_non_integer_expressions_fall_back_to_zero():
+    # C comma operator -> Python tuple; lists; calls
+    for expr in ("n,1", "(n, 1)", "[n]", "abs(n)", "n.real"):
+        rule = PluralRule.from_expression(expr, nplurals=2)
+        assert rule.py_expr is None
+        assert rule(5) == 0